@@ -2,16 +2,12 @@
 Simple Test Script - Validates Code Structure Without API Calls
 This tests the basic functionality without requiring OpenAI API
 """
-import sys
 from pathlib import Path
 
-# Add src directory to path
-sys.path.append(str(Path(__file__).parent / "src"))
-
 def test_imports():
     """Test that all modules can be imported correctly"""
     try:
-        from src.models import TestSuite, TestScenario, UserStoryInput
+        from test_case_agent.models import TestSuite, TestScenario, UserStoryInput
         print("✅ Models imported successfully")
         
         # Test UserStoryInput validation
@@ -65,10 +61,10 @@ def test_cli_structure():
         import click
         print("✅ Click library available")
         
-        # Read main.py to verify structure
-        main_file = Path(__file__).parent / "main.py"
-        if main_file.exists():
-            content = main_file.read_text()
+        # Read the CLI module to verify structure
+        cli_file = Path(__file__).parent / "test_case_agent" / "cli.py"
+        if cli_file.exists():
+            content = cli_file.read_text(encoding="utf-8")
             
             # Check for key CLI components
             checks = [
@@ -88,7 +84,7 @@ def test_cli_structure():
             
             return True
         else:
-            print("❌ main.py not found")
+            print("❌ test_case_agent/cli.py not found")
             return False
             
     except ImportError:
@@ -102,11 +98,13 @@ def test_project_structure():
     """Test that project has proper structure"""
     expected_files = [
         "main.py",
+        "pyproject.toml",
         "requirements.txt", 
         ".env.example",
-        "src/__init__.py",
-        "src/models.py",
-        "src/test_case_generator.py",
+        "test_case_agent/__init__.py",
+        "test_case_agent/cli.py",
+        "test_case_agent/models.py",
+        "test_case_agent/test_case_generator.py",
         "tests/__init__.py",
         "tests/test_generator.py",
         "examples/sample_user_stories.json",
@@ -1,10 +0,0 @@
-"""
-Test Case Generator AI Agent
-Package initialization
-"""
-
-from .test_case_generator import TestCaseGenerator
-from .models import TestSuite, TestScenario, UserStoryInput
-
-__version__ = "1.0.0"
-__all__ = ["TestCaseGenerator", "TestSuite", "TestScenario", "UserStoryInput"]
\ No newline at end of file
@@ -0,0 +1,17 @@
+"""
+Test Case Generator AI Agent
+Package initialization
+"""
+
+from .models import TestSuite, TestScenario, UserStoryInput
+
+__version__ = "1.0.0"
+__all__ = ["TestCaseGenerator", "TestSuite", "TestScenario", "UserStoryInput"]
+
+
+def __getattr__(name):
+    # Defer the LangChain/OpenAI import until the generator is actually used
+    if name == "TestCaseGenerator":
+        from .test_case_generator import TestCaseGenerator
+        return TestCaseGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
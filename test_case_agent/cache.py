@@ -0,0 +1,197 @@
+"""
+Response cache for the Test Case Generator AI Agent
+Stores generated test suites so repeated (or near-identical) user stories skip the API call
+"""
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+# numpy is only needed by the opt-in semantic tier, so it is imported on first use
+if TYPE_CHECKING:
+    import numpy as np
+
+DEFAULT_CACHE_DIR = ".tcgen_cache"
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+
+
+def make_cache_key(model_name: str, temperature: float, user_story: str,
+                   acceptance_criteria: Optional[List[str]] = None, prompt: str = "",
+                   max_tokens: Optional[int] = None, response_format: str = "") -> str:
+    """Build a stable cache key for a story under the given model settings and static prompt"""
+    parts = [model_name, repr(temperature), repr(max_tokens), response_format, prompt,
+             user_story, *(acceptance_criteria or [])]
+    return hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed store of raw test suite JSON keyed by make_cache_key"""
+    
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        """Open (or create) the cache database inside cache_dir"""
+        path = Path(cache_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        
+        self._conn = sqlite3.connect(path / "responses.sqlite3", check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, namespace TEXT NOT NULL, vector BLOB NOT NULL)"
+            )
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached JSON for key, or None on a miss"""
+        row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set(self, key: str, value: bytes) -> None:
+        """Store the JSON for key, replacing any previous entry"""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, value)
+            )
+    
+    def get_embeddings(self, namespace: str) -> List[Tuple[str, bytes]]:
+        """Return all (key, vector) pairs stored under namespace"""
+        return self._conn.execute(
+            "SELECT key, vector FROM embeddings WHERE namespace = ?", (namespace,)
+        ).fetchall()
+    
+    def set_embedding(self, key: str, namespace: str, vector: bytes) -> None:
+        """Store the story embedding for key under namespace"""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, namespace, vector) VALUES (?, ?, ?)",
+                (key, namespace, vector)
+            )
+    
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        self._conn.close()
+
+
+class LLMCache:
+    """
+    Two-tier cache of generated test suite JSON
+    
+    Exact matches are served from an in-memory LRU sitting in front of an
+    optional persistent ResponseCache. When an embeddings client is given,
+    exact misses fall back to the stored suite whose story embedding is most
+    similar, as long as the cosine similarity reaches similarity_threshold.
+    """
+    
+    def __init__(self, backend: Optional[ResponseCache] = None, max_entries: int = 256,
+                 embeddings: Any = None, similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 namespace: str = ""):
+        """
+        Args:
+            backend: Persistent store shared across runs; memory-only when None
+            max_entries: Number of suites kept in the in-memory LRU
+            embeddings: Client with embed_query/aembed_query (e.g. OpenAIEmbeddings);
+                enables the semantic tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            namespace: Model settings the semantic index is scoped to
+        """
+        self.backend = backend
+        self.max_entries = max_entries
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.namespace = namespace
+        
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._index_keys: Optional[List[str]] = None
+        self._index_vectors: List["np.ndarray"] = []
+        self._index_matrix: Optional["np.ndarray"] = None
+    
+    @property
+    def semantic(self) -> bool:
+        """Whether the semantic similarity tier is enabled"""
+        return self.embeddings is not None
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached JSON for an exact key match, or None"""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            return value
+        
+        if self.backend is not None:
+            value = self.backend.get(key)
+            if value is not None:
+                self._remember(key, value)
+        return value
+    
+    def set(self, key: str, value: bytes, vector: Optional["np.ndarray"] = None) -> None:
+        """Store JSON under key, adding its story embedding to the semantic index if given"""
+        self._remember(key, value)
+        if self.backend is not None:
+            self.backend.set(key, value)
+        
+        if vector is not None:
+            self._load_index()
+            self._index_keys.append(key)
+            self._index_vectors.append(vector)
+            self._index_matrix = None
+            if self.backend is not None:
+                self.backend.set_embedding(key, self.namespace, vector.tobytes())
+    
+    def embed(self, text: str) -> "np.ndarray":
+        """Embed text as a unit-length vector"""
+        return self._normalize(self.embeddings.embed_query(text))
+    
+    async def aembed(self, text: str) -> "np.ndarray":
+        """Async version of embed"""
+        return self._normalize(await self.embeddings.aembed_query(text))
+    
+    def get_similar(self, vector: "np.ndarray") -> Optional[bytes]:
+        """Return the JSON of the most similar stored story if it clears the threshold"""
+        import numpy as np
+        
+        self._load_index()
+        if not self._index_keys:
+            return None
+        
+        if self._index_matrix is None:
+            self._index_matrix = np.vstack(self._index_vectors)
+        
+        similarities = self._index_matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return self.get(self._index_keys[best])
+    
+    def close(self) -> None:
+        """Close the persistent backend, if any"""
+        if self.backend is not None:
+            self.backend.close()
+    
+    def _remember(self, key: str, value: bytes) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+    
+    def _load_index(self) -> None:
+        """Load stored embeddings for this namespace on first use"""
+        if self._index_keys is not None:
+            return
+        
+        import numpy as np
+        
+        rows = self.backend.get_embeddings(self.namespace) if self.backend is not None else []
+        self._index_keys = [key for key, _ in rows]
+        self._index_vectors = [np.frombuffer(vector, dtype=np.float32) for _, vector in rows]
+    
+    @staticmethod
+    def _normalize(vector: List[float]) -> "np.ndarray":
+        """Convert an embedding to a float32 unit vector"""
+        import numpy as np
+        
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
@@ -0,0 +1,349 @@
+"""
+Command Line Interface for the Test Case Generator AI Agent
+"""
+import asyncio
+import click
+import contextlib
+import orjson
+import sys
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional
+from pydantic import TypeAdapter
+
+from .models import TestSuite
+
+# TestCaseGenerator pulls in LangChain/OpenAI, so commands import it only when they need it
+if TYPE_CHECKING:
+    from .test_case_generator import TestCaseGenerator
+
+# Serializes a whole batch in one pass through pydantic-core
+_TEST_SUITES_ADAPTER = TypeAdapter(List[TestSuite])
+
+
+@click.group()
+@click.version_option(version="1.0.0")
+def cli():
+    """Test Case Generator AI Agent - Generate comprehensive test scenarios from user stories."""
+    pass
+
+
+@cli.command()
+@click.option('--story', '-s', required=True, help='User story to generate test cases for')
+@click.option('--criteria', '-c', multiple=True, help='Acceptance criteria (can be specified multiple times)')
+@click.option('--output', '-o', type=click.Choice(['console', 'json', 'markdown']), default='console', 
+              help='Output format')
+@click.option('--save', help='Save output to file')
+@click.option('--verbose', '-v', is_flag=True, help='Verbose output')
+@click.option('--no-cache', is_flag=True, help='Always call the API instead of reusing cached results')
+@click.option('--deterministic', is_flag=True, help='Generate with temperature 0 for repeatable, cacheable results')
+@click.option('--stream', is_flag=True, help='Print each scenario as soon as it is generated (console output only)')
+def generate(story: str, criteria: tuple, output: str, save: Optional[str], verbose: bool, no_cache: bool,
+             deterministic: bool, stream: bool):
+    """Generate test cases from a user story."""
+    from .test_case_generator import TestCaseGenerator
+    
+    try:
+        if verbose:
+            click.echo("🚀 Initializing Test Case Generator...")
+        
+        # Initialize the generator
+        generator = TestCaseGenerator(use_cache=not no_cache, deterministic=deterministic)
+        
+        if verbose:
+            click.echo(f"📝 Processing user story: {story[:50]}...")
+        
+        # Convert criteria tuple to list
+        acceptance_criteria = list(criteria) if criteria else None
+        
+        if stream and output == 'console' and not save:
+            # Show scenarios as they stream in; other formats need the whole suite first
+            shown = 0
+            
+            def on_scenario(scenario):
+                nonlocal shown
+                shown += 1
+                click.echo(generator.format_scenario(scenario, shown))
+            
+            test_suite = generator.stream_test_cases(story, acceptance_criteria, on_scenario=on_scenario)
+            click.echo(f"\n✅ Generated {test_suite.total_scenarios} test scenarios "
+                       f"(coverage: {', '.join(test_suite.coverage_areas)})")
+            return
+        
+        # Generate test cases
+        test_suite = generator.generate_test_cases(story, acceptance_criteria)
+        
+        if verbose:
+            click.echo(f"✅ Generated {test_suite.total_scenarios} test scenarios")
+        
+        # Format output
+        formatted_output = generator.format_output(test_suite, output)
+        
+        # Display or save output
+        if save:
+            Path(save).write_text(formatted_output, encoding='utf-8')
+            click.echo(f"💾 Output saved to: {save}")
+        else:
+            click.echo(formatted_output)
+            
+    except ValueError as e:
+        click.echo(f"❌ Validation Error: {str(e)}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"❌ Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--example', '-e', type=click.Choice(['login', 'ecommerce', 'api', 'mobile', 'all']), 
+              default='login', help='Example user story to demonstrate (all runs every example concurrently)')
+@click.option('--output', '-o', type=click.Choice(['console', 'json', 'markdown']), default='console',
+              help='Output format')
+@click.option('--no-cache', is_flag=True, help='Always call the API instead of reusing cached results')
+@click.option('--deterministic', is_flag=True, help='Generate with temperature 0 for repeatable, cacheable results')
+def demo(example: str, output: str, no_cache: bool, deterministic: bool):
+    """Run demo with predefined user stories."""
+    from .test_case_generator import TestCaseGenerator
+    
+    examples = {
+        'login': {
+            'story': 'As a registered user, I want to log into my account using my email and password so that I can access my personalized dashboard.',
+            'criteria': [
+                'User can enter valid email and password',
+                'System validates credentials against database',
+                'User is redirected to dashboard on successful login',
+                'Error message shown for invalid credentials',
+                'Account locked after 3 failed attempts'
+            ]
+        },
+        'ecommerce': {
+            'story': 'As a customer, I want to add items to my shopping cart and proceed to checkout so that I can purchase products online.',
+            'criteria': [
+                'User can add products to cart',
+                'Cart displays correct items and quantities',
+                'User can modify cart contents',
+                'Checkout process calculates total correctly',
+                'Payment is processed securely'
+            ]
+        },
+        'api': {
+            'story': 'As a developer, I want to integrate with a REST API to retrieve user data so that I can display user profiles in my application.',
+            'criteria': [
+                'API returns user data in JSON format',
+                'Authentication token is required',
+                'Rate limiting is enforced',
+                'Error responses are properly formatted',
+                'Data includes all required user fields'
+            ]
+        },
+        'mobile': {
+            'story': 'As a mobile app user, I want to receive push notifications for important updates so that I stay informed about relevant activities.',
+            'criteria': [
+                'Notifications appear on device lock screen',
+                'User can enable/disable notifications',
+                'Notifications are categorized by importance',
+                'Tapping notification opens relevant app section',
+                'Notification history is maintained'
+            ]
+        }
+    }
+    
+    selected = list(examples) if example == 'all' else [example]
+    
+    for name in selected:
+        click.echo(f"🎯 Running demo with '{name}' user story...")
+        click.echo(f"Story: {examples[name]['story']}")
+        click.echo()
+    
+    # Use the generate command logic
+    try:
+        generator = TestCaseGenerator(use_cache=not no_cache, deterministic=deterministic)
+        
+        if len(selected) > 1:
+            # Send every example at once; results come back in the order requested
+            test_suites = generator.generate_test_cases_batch(
+                [(examples[name]['story'], examples[name]['criteria']) for name in selected]
+            )
+        else:
+            test_suites = [generator.generate_test_cases(
+                examples[example]['story'], 
+                examples[example]['criteria']
+            )]
+        
+        if output == 'json' and len(test_suites) > 1:
+            # Several suites form one JSON array rather than back-to-back documents
+            formatted_output = _TEST_SUITES_ADAPTER.dump_json(test_suites, indent=2).decode('utf-8')
+        else:
+            formatted_output = "\n\n".join(
+                generator.format_output(test_suite, output) for test_suite in test_suites
+            )
+        click.echo(formatted_output)
+        
+    except Exception as e:
+        click.echo(f"❌ Demo Error: {str(e)}", err=True)
+        sys.exit(1)
+
+
+@cli.command()
+def setup():
+    """Setup the environment and check configuration."""
+    
+    click.echo("🔧 Test Case Generator Setup")
+    click.echo("=" * 40)
+    
+    # Check for .env file
+    env_file = Path(".env")
+    if env_file.exists():
+        click.echo("✅ .env file found")
+    else:
+        click.echo("❌ .env file not found")
+        click.echo("Please copy .env.example to .env and add your OpenAI API key")
+        return
+    
+    # Check for OpenAI API key
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key and api_key != "your_openai_api_key_here":
+            click.echo("✅ OpenAI API key configured")
+        else:
+            click.echo("❌ OpenAI API key not configured")
+            click.echo("Please set OPENAI_API_KEY in your .env file")
+            return
+    except ImportError:
+        click.echo("❌ Required packages not installed")
+        click.echo("Please run: pip install -r requirements.txt")
+        return
+    
+    # Test the generator
+    try:
+        from .test_case_generator import TestCaseGenerator
+        
+        generator = TestCaseGenerator()
+        click.echo("✅ Test Case Generator initialized successfully")
+        
+        # Run a quick test
+        test_story = "As a user, I want to test the system."
+        result = generator.generate_test_cases(test_story)
+        click.echo(f"✅ Test generation successful ({len(result.test_scenarios)} scenarios)")
+        
+    except Exception as e:
+        click.echo(f"❌ Generator test failed: {str(e)}")
+        return
+    
+    click.echo("\n🎉 Setup complete! You can now use the generator.")
+    click.echo("Try: python main.py demo --example login")
+    click.echo("     (or tcgen demo --example login after pip install -e .)")
+
+
+def _write_line(out, line: bytes):
+    """Write a line and flush it so consumers see it immediately"""
+    out.write(line)
+    out.flush()
+
+
+async def _write_ndjson(generator: "TestCaseGenerator", stories: list, out, on_complete) -> None:
+    """
+    Write each test suite to out as one JSON line as soon as it is generated
+    
+    Lines arrive in completion order, so each one carries the position of its
+    story in the input: {"index": i, "test_suite": {...}}
+    """
+    async for index, test_suite in generator.aiter_test_cases(stories):
+        line = b'{"index":%d,"test_suite":%s}\n' % (index, test_suite.model_dump_json().encode('utf-8'))
+        # Write from a worker thread so the event loop keeps collecting responses
+        await asyncio.to_thread(_write_line, out, line)
+        on_complete(test_suite)
+
+
+@cli.command()
+@click.argument('input_file', type=click.File('rb'))
+@click.option('--output', '-o', type=click.Choice(['console', 'json', 'markdown', 'ndjson']), default='console',
+              help='Output format (ndjson streams one indexed suite per line as each finishes)')
+@click.option('--save', help='Save output to file')
+@click.option('--verbose', '-v', is_flag=True, help='Log each story as it completes instead of a progress bar')
+@click.option('--no-cache', is_flag=True, help='Always call the API instead of reusing cached results')
+@click.option('--deterministic', is_flag=True, help='Generate with temperature 0 for repeatable, cacheable results')
+def batch(input_file, output: str, save: Optional[str], verbose: bool, no_cache: bool,
+          deterministic: bool):
+    """Process multiple user stories from a file."""
+    from .test_case_generator import TestCaseGenerator
+    
+    click.echo("📦 Processing batch file...", err=True)
+    
+    try:
+        # Read input file (expecting JSON format) as raw bytes for orjson
+        data = orjson.loads(input_file.read())
+        
+        if not isinstance(data, list):
+            raise ValueError("Input file should contain a JSON array of user stories")
+        
+        stories = [
+            (story_data, None) if isinstance(story_data, str)
+            else (story_data.get('story', ''), story_data.get('criteria', None))
+            for story_data in data
+        ]
+        
+        generator = TestCaseGenerator(use_cache=not no_cache, deterministic=deterministic)
+        
+        total = len(stories)
+        completed = 0
+        
+        if verbose:
+            click.echo(f"📝 Loaded {total} user stories", err=True)
+            progress = contextlib.nullcontext()
+            
+            def on_complete(test_suite: TestSuite):
+                nonlocal completed
+                completed += 1
+                click.echo(f"✅ Story {completed}/{total}: {test_suite.total_scenarios} test scenarios",
+                           err=True)
+        else:
+            # Redraw the progress bar in ~1% steps instead of once per story
+            redraw_step = max(1, total // 100)
+            progress = click.progressbar(length=total, label='Generating test cases', file=sys.stderr)
+            
+            def on_complete(_: TestSuite):
+                nonlocal completed
+                completed += 1
+                if completed - progress.pos >= redraw_step or completed == total:
+                    progress.update(completed - progress.pos)
+        
+        # Submit every story at once and report each one as it completes
+        with progress:
+            if output == 'ndjson':
+                # Stream suites in completion order instead of holding the whole batch in memory
+                if save:
+                    with open(save, 'wb') as out:
+                        asyncio.run(_write_ndjson(generator, stories, out, on_complete))
+                else:
+                    asyncio.run(_write_ndjson(generator, stories, click.get_binary_stream('stdout'),
+                                              on_complete))
+            else:
+                all_results = generator.generate_test_cases_batch(stories, on_complete=on_complete)
+        
+        if output == 'ndjson':
+            if save:
+                click.echo(f"💾 Batch results saved to: {save}")
+            return
+        
+        # Format combined output
+        if output == 'json':
+            combined_output = _TEST_SUITES_ADAPTER.dump_json(all_results, indent=2)
+        else:
+            combined_output = "\n\n".join([
+                generator.format_output(result, output) for result in all_results
+            ]).encode('utf-8')
+        
+        # Display or save
+        if save:
+            Path(save).write_bytes(combined_output)
+            click.echo(f"💾 Batch results saved to: {save}")
+        else:
+            # Bytes go straight to the binary stdout stream, skipping re-encoding
+            click.echo(combined_output)
+            
+    except Exception as e:
+        click.echo(f"❌ Batch processing error: {str(e)}", err=True)
+        sys.exit(1)
@@ -2,11 +2,16 @@
 Data models for the Test Case Generator AI Agent
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Models are immutable once validated, so they can be shared without defensive copies
+_MODEL_CONFIG = ConfigDict(frozen=True, str_strip_whitespace=True, populate_by_name=True)
 
 
 class TestScenario(BaseModel):
     """Represents a single test scenario"""
+    model_config = _MODEL_CONFIG
+    
     scenario_id: str = Field(description="Unique identifier for the test scenario")
     title: str = Field(description="Brief title describing the test scenario")
     description: str = Field(description="Detailed description of what to test")
@@ -19,6 +24,8 @@ class TestScenario(BaseModel):
 
 class TestSuite(BaseModel):
     """Represents a complete test suite for a user story"""
+    model_config = _MODEL_CONFIG
+    
     user_story: str = Field(description="Original user story")
     test_scenarios: List[TestScenario] = Field(description="Generated test scenarios")
     coverage_areas: List[str] = Field(description="Areas of functionality covered")
@@ -27,6 +34,8 @@ class TestSuite(BaseModel):
 
 class UserStoryInput(BaseModel):
     """Input validation for user stories"""
+    model_config = _MODEL_CONFIG
+    
     story: str = Field(min_length=10, description="User story description")
     acceptance_criteria: Optional[List[str]] = Field(default=None, description="Optional acceptance criteria")
     story_type: Optional[str] = Field(default="feature", description="Type of user story")
\ No newline at end of file
@@ -0,0 +1,82 @@
+"""
+Incremental parsing of streamed responses for the Test Case Generator AI Agent
+Surfaces each test scenario as soon as its JSON object has fully arrived
+"""
+import json
+from typing import List, Optional
+
+from .models import TestScenario
+
+_SCENARIOS_KEY = '"test_scenarios"'
+_SEPARATORS = " \t\r\n,"
+
+
+class ScenarioStream:
+    """Extracts complete TestScenario objects from a TestSuite JSON response as it streams in"""
+    
+    def __init__(self):
+        """Start with an empty response"""
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos: Optional[int] = None
+        self._done = False
+        self._decoder = json.JSONDecoder()
+    
+    @property
+    def text(self) -> str:
+        """The full response text received so far"""
+        if self._chunks:
+            self._buffer += "".join(self._chunks)
+            self._chunks.clear()
+        return self._buffer
+    
+    def feed(self, chunk: str) -> List[TestScenario]:
+        """
+        Add the next chunk of the response
+        
+        Args:
+            chunk: Text received from the model since the last call
+        
+        Returns:
+            Scenarios completed by this chunk, in response order
+        """
+        self._chunks.append(chunk)
+        if self._done:
+            return []
+        
+        # Scenarios can only complete once the closing brace of an object arrives
+        if self._pos is not None and "}" not in chunk:
+            return []
+        
+        buffer = self.text
+        if self._pos is None:
+            key = buffer.find(_SCENARIOS_KEY)
+            # Skip an escaped occurrence inside an earlier string value
+            while key > 0 and buffer[key - 1] == "\\":
+                key = buffer.find(_SCENARIOS_KEY, key + 1)
+            start = buffer.find("[", key) if key != -1 else -1
+            if start == -1:
+                return []
+            self._pos = start + 1
+        
+        scenarios = []
+        while True:
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _SEPARATORS:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if buffer[pos] == "]":
+                self._done = True
+                break
+            
+            try:
+                data, end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The next scenario has not fully arrived yet
+                break
+            
+            scenarios.append(TestScenario.model_validate(data))
+            self._pos = end
+        
+        return scenarios
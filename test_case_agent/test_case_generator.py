@@ -0,0 +1,629 @@
+"""
+Test Case Generator AI Agent
+Main class that handles the AI processing and test case generation
+"""
+import asyncio
+import functools
+import io
+import json
+import os
+from typing import AsyncIterator, Callable, List, Dict, Any, Optional, Tuple
+import orjson
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from .cache import (
+    DEFAULT_CACHE_DIR, DEFAULT_SIMILARITY_THRESHOLD, LLMCache, ResponseCache, make_cache_key
+)
+from .models import TestSuite, TestScenario, UserStoryInput
+from .streaming import ScenarioStream
+
+# Opening marker of a fenced JSON block in a model response
+_JSON_FENCE = "```json"
+
+# LangChain's OpenAI integration takes about a second to import, so it is
+# loaded when the first generator is created (see _import_langchain_openai)
+ChatOpenAI = None
+OpenAIEmbeddings = None
+
+# ChatOpenAI instances shared by generators with the same settings, so they
+# reuse one pool of HTTP connections to the API instead of opening their own
+_LLM_POOL: Dict[tuple, Any] = {}
+
+_RULE = "=" * 80
+_THIN_RULE = "-" * 40
+
+# Suite headers are fixed templates built once at import
+_CONSOLE_HEADER_TEMPLATE = "\n".join([
+    _RULE,
+    "TEST CASE GENERATOR RESULTS",
+    _RULE,
+    "\nUser Story: {user_story}",
+    "Total Test Scenarios: {total_scenarios}",
+    "Coverage Areas: {coverage_areas}",
+    "\n" + _RULE,
+])
+
+_MARKDOWN_HEADER_TEMPLATE = "\n".join([
+    "# Test Case Generator Results",
+    "\n**User Story:** {user_story}",
+    "**Total Test Scenarios:** {total_scenarios}",
+    "**Coverage Areas:** {coverage_areas}",
+])
+
+
+def _reset_llm_pool() -> None:
+    """Drop all shared ChatOpenAI instances, e.g. after changing how they are created"""
+    _LLM_POOL.clear()
+
+
+def _import_langchain_openai() -> None:
+    """Import the LangChain OpenAI classes on first use"""
+    global ChatOpenAI, OpenAIEmbeddings
+    if ChatOpenAI is None:
+        from langchain_openai import ChatOpenAI
+    if OpenAIEmbeddings is None:
+        from langchain_openai import OpenAIEmbeddings
+
+
+@functools.cache
+def _test_suite_schema() -> Dict[str, Any]:
+    """JSON schema of TestSuite, generated once per process and shared read-only"""
+    return TestSuite.model_json_schema()
+
+
+@functools.cache
+def _format_instructions() -> str:
+    """Render the JSON format instructions for the TestSuite schema"""
+    # Same text PydanticOutputParser produces, without its deprecated .schema() call
+    from langchain.output_parsers.format_instructions import PYDANTIC_FORMAT_INSTRUCTIONS
+    
+    reduced_schema = {k: v for k, v in _test_suite_schema().items() if k not in ("title", "type")}
+    return PYDANTIC_FORMAT_INSTRUCTIONS.format(schema=json.dumps(reduced_schema))
+
+
+class TestCaseGenerator:
+    """AI Agent for generating test cases from user stories"""
+    
+    def __init__(self, use_cache: bool = False, deterministic: bool = False):
+        """
+        Initialize the Test Case Generator
+        
+        Args:
+            use_cache: Reuse previously generated test suites for identical
+                stories from the on-disk cache (CACHE_DIR, default .tcgen_cache),
+                and for near-identical ones when SEMANTIC_CACHE_THRESHOLD is set
+            deterministic: Generate with temperature 0 regardless of TEMPERATURE,
+                so repeated runs (e.g. in CI) give stable, cache-friendly results
+        """
+        from dotenv import load_dotenv
+        load_dotenv()
+        
+        # Validate environment variables
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY not found in environment variables")
+        
+        # Initialize OpenAI model
+        self.model_name = os.getenv("MODEL_NAME", "gpt-3.5-turbo")
+        self.temperature = 0.0 if deterministic else float(os.getenv("TEMPERATURE", "0.3"))
+        self.max_tokens = int(os.getenv("MAX_TOKENS", "2000"))
+        
+        # Upper bound on concurrent API requests during batch generation
+        self.max_concurrent = int(os.getenv("MAX_CONCURRENT", "32"))
+        
+        # How the API is asked to return JSON: json_object, json_schema or text
+        self.response_format = os.getenv("RESPONSE_FORMAT", "json_object")
+        if self.response_format not in ("json_object", "json_schema", "text"):
+            raise ValueError(f"Unsupported RESPONSE_FORMAT: {self.response_format}")
+        
+        _import_langchain_openai()
+        llm_key = (self.model_name, self.temperature, self.max_tokens, self.api_key, self.response_format)
+        self.llm = _LLM_POOL.get(llm_key)
+        if self.llm is None:
+            self.llm = _LLM_POOL[llm_key] = ChatOpenAI(
+                model=self.model_name,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                openai_api_key=self.api_key,
+                model_kwargs=self._response_format_kwargs()
+            )
+        
+        # Static prompts are built once and sent before the story so every request
+        # shares a byte-identical prefix the API can serve from its prompt cache
+        self._format_instructions = _format_instructions()
+        self._system_prompt = self._create_system_prompt()
+        self._system_message = SystemMessage(content=self._system_prompt)
+        self._instructions_message = HumanMessage(content=self._create_instructions_prompt())
+        self._prompt_prefix = "\n".join([self._system_prompt, self._instructions_message.content])
+        
+        # Output formatters by format name, used by format_output
+        self._formatters: Dict[str, Callable[[TestSuite], str]] = {
+            "console": self._format_console,
+            "json": self._format_json,
+            "markdown": self._format_markdown,
+        }
+        
+        # Optional cache of generated suites
+        self.cache = self._create_cache() if use_cache else None
+    
+    def _create_cache(self) -> LLMCache:
+        """Create the response cache configured from the environment"""
+        threshold = os.getenv("SEMANTIC_CACHE_THRESHOLD")
+        
+        return LLMCache(
+            backend=ResponseCache(os.getenv("CACHE_DIR", DEFAULT_CACHE_DIR)),
+            embeddings=OpenAIEmbeddings(openai_api_key=self.api_key) if threshold else None,
+            similarity_threshold=float(threshold) if threshold else DEFAULT_SIMILARITY_THRESHOLD,
+            # Editing the prompts starts a fresh semantic index instead of matching stale suites
+            namespace=make_cache_key(
+                self.model_name, self.temperature, "", prompt=self._prompt_prefix,
+                max_tokens=self.max_tokens, response_format=self.response_format
+            )
+        )
+    
+    def _response_format_kwargs(self) -> Dict[str, Any]:
+        """Build the model kwargs that make the API return test suite JSON directly"""
+        if self.response_format == "json_schema":
+            return {"response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "TestSuite", "schema": _test_suite_schema()}
+            }}
+        if self.response_format == "json_object":
+            return {"response_format": {"type": "json_object"}}
+        return {}
+    
+    def validate_user_story(self, user_story: str, acceptance_criteria: List[str] = None,
+                            validate: bool = True) -> UserStoryInput:
+        """
+        Validate user story input
+        
+        Args:
+            user_story: The user story to validate
+            acceptance_criteria: Optional list of acceptance criteria
+            validate: Set to False when the caller has already validated and
+                stripped the input (e.g. batch or CI pipelines) to build the
+                model without running validation
+        """
+        if not validate:
+            return UserStoryInput.model_construct(
+                story=user_story,
+                acceptance_criteria=acceptance_criteria,
+                story_type="feature"
+            )
+        
+        try:
+            return UserStoryInput(
+                story=user_story,
+                acceptance_criteria=acceptance_criteria
+            )
+        except Exception as e:
+            raise ValueError(f"Invalid user story input: {str(e)}")
+    
+    def _create_system_prompt(self) -> str:
+        """Create the system prompt for the AI agent"""
+        return """You are an expert QA engineer and test case generator. Your task is to analyze user stories and generate comprehensive test scenarios.
+
+For each user story, you should:
+1. Identify all testable aspects and edge cases
+2. Create positive, negative, and boundary test scenarios
+3. Include proper test steps, preconditions, and expected results
+4. Prioritize tests based on risk and importance
+5. Ensure good test coverage
+
+Generate test scenarios that cover:
+- Happy path scenarios (positive testing)
+- Error scenarios (negative testing)
+- Boundary conditions and edge cases
+- Integration points
+- User experience aspects
+- Performance considerations (when relevant)
+- Security aspects (when relevant)
+
+Each test scenario should be:
+- Clear and unambiguous
+- Executable by any QA tester
+- Include specific steps and expected outcomes
+- Properly categorized by type and priority"""
+
+    def _create_instructions_prompt(self) -> str:
+        """Create the static generation instructions sent ahead of every user story"""
+        return f"""Please generate comprehensive test scenarios for the user story that follows.
+
+Please provide a complete test suite in the following JSON format:
+{self._format_instructions}
+
+Generate 5-8 diverse test scenarios covering different testing aspects (positive, negative, edge cases, etc.).
+Make sure each scenario has a unique ID, clear steps, and specific expected results."""
+    
+    def _create_user_prompt(self, validated_input: UserStoryInput) -> str:
+        """Create the user prompt with the user story"""
+        prompt = f"""**User Story:** {validated_input.story}
+"""
+        
+        if validated_input.acceptance_criteria:
+            prompt += f"""
+**Acceptance Criteria:**
+{chr(10).join(f"- {criteria}" for criteria in validated_input.acceptance_criteria)}
+"""
+        
+        return prompt
+    
+    def _parse_ai_response(self, response_text: str) -> TestSuite:
+        """Parse the AI response into structured test suite"""
+        try:
+            # Try to extract JSON from the response if it's wrapped in markdown
+            json_text = response_text
+            start = response_text.find(_JSON_FENCE)
+            if start != -1:
+                end = response_text.find("```", start + len(_JSON_FENCE))
+                if end != -1:
+                    json_text = response_text[start + len(_JSON_FENCE):end].strip()
+            
+            # Parse the JSON (orjson then validation beats model_validate_json on these payloads)
+            parsed_data = orjson.loads(json_text)
+            
+            # Create TestSuite object
+            return TestSuite.model_validate(parsed_data)
+            
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Failed to parse AI response as JSON: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Failed to create TestSuite object: {str(e)}")
+    
+    def _build_messages(self, validated_input: UserStoryInput) -> list:
+        """Build the chat messages for the LLM, static prefix first and the story last"""
+        return [
+            self._system_message,
+            self._instructions_message,
+            HumanMessage(content=self._create_user_prompt(validated_input))
+        ]
+    
+    def _build_test_suite(self, response_text: str) -> TestSuite:
+        """Parse the AI response and fill in the suite metadata"""
+        test_suite = self._parse_ai_response(response_text)
+        
+        # Suites are frozen, so correct the count on a copy if the model miscounted
+        total_scenarios = len(test_suite.test_scenarios)
+        if test_suite.total_scenarios != total_scenarios:
+            test_suite = test_suite.model_copy(update={"total_scenarios": total_scenarios})
+        
+        return test_suite
+    
+    def _cache_key(self, validated_input: UserStoryInput) -> str:
+        """Cache key for a validated story under the current model settings and prompts"""
+        return make_cache_key(
+            self.model_name, self.temperature,
+            validated_input.story, validated_input.acceptance_criteria,
+            prompt=self._prompt_prefix, max_tokens=self.max_tokens, response_format=self.response_format
+        )
+    
+    def _cache_text(self, validated_input: UserStoryInput) -> str:
+        """Text embedded for semantic cache lookups"""
+        return "\n".join([validated_input.story, *(validated_input.acceptance_criteria or [])])
+    
+    def _get_cached(self, validated_input: UserStoryInput) -> Tuple[Optional[TestSuite], Any]:
+        """
+        Look up a cached suite by exact key, then by story similarity
+        
+        Returns:
+            (cached TestSuite or None, story embedding computed for the lookup or None)
+        """
+        cached = self.cache.get(self._cache_key(validated_input))
+        if cached is not None:
+            return self._load_cached(cached), None
+        
+        vector = None
+        if self.cache.semantic:
+            vector = self.cache.embed(self._cache_text(validated_input))
+            cached = self.cache.get_similar(vector)
+            if cached is not None:
+                return self._load_cached(cached, validated_input), vector
+        
+        return None, vector
+    
+    async def _aget_cached(self, validated_input: UserStoryInput) -> Tuple[Optional[TestSuite], Any]:
+        """Async version of _get_cached"""
+        cached = self.cache.get(self._cache_key(validated_input))
+        if cached is not None:
+            return self._load_cached(cached), None
+        
+        vector = None
+        if self.cache.semantic:
+            vector = await self.cache.aembed(self._cache_text(validated_input))
+            cached = self.cache.get_similar(vector)
+            if cached is not None:
+                return self._load_cached(cached, validated_input), vector
+        
+        return None, vector
+    
+    def _load_cached(self, cached: bytes, similar_to: Optional[UserStoryInput] = None) -> TestSuite:
+        """Load a cached suite, relabelling a semantic hit with the story that was asked for"""
+        test_suite = TestSuite.model_validate(orjson.loads(cached))
+        if similar_to is not None:
+            test_suite = test_suite.model_copy(update={"user_story": similar_to.story})
+        return test_suite
+    
+    def _store_cached(self, validated_input: UserStoryInput, test_suite: TestSuite, vector: Any) -> None:
+        """Store a freshly generated suite along with its story embedding"""
+        self.cache.set(
+            self._cache_key(validated_input),
+            test_suite.model_dump_json().encode("utf-8"),
+            vector
+        )
+    
+    def generate_test_cases(self, user_story: str, acceptance_criteria: List[str] = None,
+                            validate: bool = True) -> TestSuite:
+        """
+        Generate test cases for a given user story
+        
+        Args:
+            user_story: The user story to generate test cases for
+            acceptance_criteria: Optional list of acceptance criteria
+            validate: Whether to validate the input (see validate_user_story)
+            
+        Returns:
+            TestSuite object containing all generated test scenarios
+            
+        Raises:
+            ValueError: If input validation fails or AI response is invalid
+            Exception: If API call fails
+        """
+        try:
+            validated_input = self.validate_user_story(user_story, acceptance_criteria, validate)
+            
+            vector = None
+            if self.cache is not None:
+                test_suite, vector = self._get_cached(validated_input)
+                if test_suite is not None:
+                    return test_suite
+            
+            response = self.llm.invoke(self._build_messages(validated_input))
+            test_suite = self._build_test_suite(response.content)
+            
+            if self.cache is not None:
+                self._store_cached(validated_input, test_suite, vector)
+            
+            return test_suite
+            
+        except Exception as e:
+            raise Exception(f"Failed to generate test cases: {str(e)}")
+    
+    def stream_test_cases(
+        self,
+        user_story: str,
+        acceptance_criteria: List[str] = None,
+        on_scenario: Optional[Callable[[TestScenario], None]] = None,
+        validate: bool = True
+    ) -> TestSuite:
+        """
+        Generate test cases while streaming the response, reporting each scenario as it arrives
+        
+        Args:
+            user_story: The user story to generate test cases for
+            acceptance_criteria: Optional list of acceptance criteria
+            on_scenario: Optional callback invoked with each TestScenario as soon as
+                it has fully streamed in (all at once for cached suites)
+            validate: Whether to validate the input (see validate_user_story)
+            
+        Returns:
+            TestSuite object parsed from the complete response
+        """
+        try:
+            validated_input = self.validate_user_story(user_story, acceptance_criteria, validate)
+            
+            vector = None
+            if self.cache is not None:
+                test_suite, vector = self._get_cached(validated_input)
+                if test_suite is not None:
+                    if on_scenario:
+                        for scenario in test_suite.test_scenarios:
+                            on_scenario(scenario)
+                    return test_suite
+            
+            stream = ScenarioStream()
+            for chunk in self.llm.stream(self._build_messages(validated_input)):
+                for scenario in stream.feed(chunk.content):
+                    if on_scenario:
+                        on_scenario(scenario)
+            
+            # The complete response stays authoritative for the returned suite
+            test_suite = self._build_test_suite(stream.text)
+            
+            if self.cache is not None:
+                self._store_cached(validated_input, test_suite, vector)
+            
+            return test_suite
+            
+        except Exception as e:
+            raise Exception(f"Failed to generate test cases: {str(e)}")
+    
+    async def agenerate_test_cases(self, user_story: str, acceptance_criteria: List[str] = None,
+                                   validate: bool = True) -> TestSuite:
+        """Async version of generate_test_cases"""
+        try:
+            validated_input = self.validate_user_story(user_story, acceptance_criteria, validate)
+            
+            vector = None
+            if self.cache is not None:
+                test_suite, vector = await self._aget_cached(validated_input)
+                if test_suite is not None:
+                    return test_suite
+            
+            response = await self.llm.ainvoke(self._build_messages(validated_input))
+            test_suite = self._build_test_suite(response.content)
+            
+            if self.cache is not None:
+                self._store_cached(validated_input, test_suite, vector)
+            
+            return test_suite
+            
+        except Exception as e:
+            raise Exception(f"Failed to generate test cases: {str(e)}")
+    
+    async def aiter_test_cases(
+        self,
+        stories: List[Tuple[str, Optional[List[str]]]]
+    ) -> AsyncIterator[Tuple[int, TestSuite]]:
+        """
+        Generate test cases for several user stories, yielding each suite as soon as it is ready
+        
+        At most max_concurrent requests are in flight at once, so a slow story
+        only holds up its own slot while the remaining stories keep flowing.
+        Repeated stories are generated once and the suite is yielded for each
+        of their positions.
+        
+        Args:
+            stories: List of (user_story, acceptance_criteria) tuples
+            
+        Yields:
+            (index, TestSuite) tuples in completion order, where index is the
+            position of the story in the input list
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        # Input positions of each distinct (story, criteria) pair
+        positions: Dict[Any, List[int]] = {}
+        for index, (story, criteria) in enumerate(stories):
+            try:
+                positions.setdefault((story, tuple(criteria or ())), []).append(index)
+            except TypeError:
+                # Unhashable input (e.g. a dict in the criteria) is left to per-story validation
+                positions[index] = [index]
+        
+        async def _bounded(indices: List[int], user_story: str, acceptance_criteria: Optional[List[str]]):
+            async with semaphore:
+                return indices, await self.agenerate_test_cases(user_story, acceptance_criteria)
+        
+        tasks = [
+            asyncio.create_task(_bounded(indices, *stories[indices[0]]))
+            for indices in positions.values()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, test_suite = await next_done
+                for index in indices:
+                    yield index, test_suite
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def agenerate_test_cases_batch(
+        self,
+        stories: List[Tuple[str, Optional[List[str]]]],
+        on_complete: Optional[Callable[[TestSuite], None]] = None
+    ) -> List[TestSuite]:
+        """Async version of generate_test_cases_batch"""
+        results: List[Optional[TestSuite]] = [None] * len(stories)
+        
+        async for index, test_suite in self.aiter_test_cases(stories):
+            results[index] = test_suite
+            if on_complete:
+                on_complete(test_suite)
+        
+        return results
+    
+    def generate_test_cases_batch(
+        self,
+        stories: List[Tuple[str, Optional[List[str]]]],
+        on_complete: Optional[Callable[[TestSuite], None]] = None
+    ) -> List[TestSuite]:
+        """
+        Generate test cases for several user stories concurrently
+        
+        All requests are issued up front (bounded by MAX_CONCURRENT) so the
+        API can work on them in parallel instead of paying one round trip
+        per story.
+        
+        Args:
+            stories: List of (user_story, acceptance_criteria) tuples
+            on_complete: Optional callback invoked with each TestSuite as it finishes
+            
+        Returns:
+            List of TestSuite objects in the same order as the input stories
+        """
+        return asyncio.run(self.agenerate_test_cases_batch(stories, on_complete))
+    
+    def format_output(self, test_suite: TestSuite, output_format: str = "console") -> str:
+        """
+        Format the test suite output for different formats
+        
+        Args:
+            test_suite: The generated test suite
+            output_format: Format type ("console", "json", "markdown")
+            
+        Returns:
+            Formatted string representation
+        """
+        # Unknown formats fall back to console output
+        return self._formatters.get(output_format, self._format_console)(test_suite)
+    
+    def _format_json(self, test_suite: TestSuite) -> str:
+        """Format output as indented JSON"""
+        return test_suite.model_dump_json(indent=2)
+    
+    def _format_console(self, test_suite: TestSuite) -> str:
+        """Format output for console display"""
+        buf = io.StringIO()
+        buf.write(_CONSOLE_HEADER_TEMPLATE.format(
+            user_story=test_suite.user_story,
+            total_scenarios=test_suite.total_scenarios,
+            coverage_areas=', '.join(test_suite.coverage_areas)
+        ))
+        
+        for i, scenario in enumerate(test_suite.test_scenarios, 1):
+            buf.write("\n")
+            self._write_console_scenario(buf, scenario, i)
+        
+        return buf.getvalue()
+    
+    def format_scenario(self, scenario: TestScenario, index: int) -> str:
+        """
+        Format a single scenario the way console output shows it
+        
+        Args:
+            scenario: The scenario to format
+            index: 1-based position of the scenario in its suite
+            
+        Returns:
+            Formatted string representation
+        """
+        buf = io.StringIO()
+        self._write_console_scenario(buf, scenario, index)
+        return buf.getvalue()
+    
+    def _write_console_scenario(self, buf: io.StringIO, scenario: TestScenario, index: int) -> None:
+        """Write one console scenario block"""
+        # Fixed fields render as one string and each list as one joined string
+        buf.write(
+            f"\nTEST SCENARIO {index}: {scenario.scenario_id}\n{_THIN_RULE}\n"
+            f"Title: {scenario.title}\nType: {scenario.test_type}\nPriority: {scenario.priority}\n"
+            f"\nDescription: {scenario.description}\n\nPreconditions:"
+        )
+        if scenario.preconditions:
+            buf.write("\n  • " + "\n  • ".join(scenario.preconditions))
+        buf.write("\n\nTest Steps:")
+        buf.write("".join([f"\n  {step_num}. {step}" for step_num, step in enumerate(scenario.test_steps, 1)]))
+        buf.write(f"\n\nExpected Result: {scenario.expected_result}\n{_THIN_RULE}")
+    
+    def _format_markdown(self, test_suite: TestSuite) -> str:
+        """Format output as Markdown"""
+        buf = io.StringIO()
+        buf.write(_MARKDOWN_HEADER_TEMPLATE.format(
+            user_story=test_suite.user_story,
+            total_scenarios=test_suite.total_scenarios,
+            coverage_areas=', '.join(test_suite.coverage_areas)
+        ))
+        
+        for i, scenario in enumerate(test_suite.test_scenarios, 1):
+            buf.write(
+                f"\n\n## Test Scenario {i}: {scenario.scenario_id}\n"
+                f"**Title:** {scenario.title}\n**Type:** {scenario.test_type}\n**Priority:** {scenario.priority}\n"
+                f"\n**Description:** {scenario.description}\n\n**Preconditions:**"
+            )
+            if scenario.preconditions:
+                buf.write("\n- " + "\n- ".join(scenario.preconditions))
+            buf.write("\n\n**Test Steps:**")
+            buf.write("".join([f"\n{step_num}. {step}" for step_num, step in enumerate(scenario.test_steps, 1)]))
+            buf.write(f"\n\n**Expected Result:** {scenario.expected_result}")
+        
+        return buf.getvalue()
\ No newline at end of file
@@ -0,0 +1,140 @@
+"""
+Unit tests for the response cache
+"""
+import tempfile
+import unittest
+
+from test_case_agent.cache import LLMCache, ResponseCache, make_cache_key
+
+
+class FakeEmbeddings:
+    """Embeddings stub mapping known texts to fixed vectors"""
+    
+    def __init__(self, vectors):
+        self.vectors = vectors
+    
+    def embed_query(self, text):
+        return self.vectors[text]
+
+
+class TestMakeCacheKey(unittest.TestCase):
+    """Test cache key construction"""
+    
+    def test_same_input_same_key(self):
+        """Test that identical inputs produce identical keys"""
+        key1 = make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"])
+        key2 = make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"])
+        
+        self.assertEqual(key1, key2)
+    
+    def test_key_depends_on_all_inputs(self):
+        """Test that model settings, prompt, story and criteria all change the key"""
+        base = make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"])
+        
+        self.assertNotEqual(base, make_cache_key("gpt-4", 0.3, "As a user, I want to login", ["Valid login"]))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.0, "As a user, I want to login", ["Valid login"]))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to logout", ["Valid login"]))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", None))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"],
+                                                 prompt="You are a QA engineer"))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"],
+                                                 max_tokens=500))
+        self.assertNotEqual(base, make_cache_key("gpt-3.5-turbo", 0.3, "As a user, I want to login", ["Valid login"],
+                                                 response_format="text"))
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test the SQLite-backed response cache"""
+    
+    def setUp(self):
+        """Set up a cache in a temporary directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(self.tmp_dir.name)
+    
+    def tearDown(self):
+        """Close the cache and remove its directory"""
+        self.cache.close()
+        self.tmp_dir.cleanup()
+    
+    def test_miss_returns_none(self):
+        """Test that unknown keys are a miss"""
+        self.assertIsNone(self.cache.get("missing"))
+    
+    def test_set_and_get(self):
+        """Test storing and reading back a value"""
+        self.cache.set("key", b'{"user_story": "Test story"}')
+        
+        self.assertEqual(self.cache.get("key"), b'{"user_story": "Test story"}')
+    
+    def test_persists_across_instances(self):
+        """Test that stored values survive reopening the cache"""
+        self.cache.set("key", b"value")
+        
+        reopened = ResponseCache(self.tmp_dir.name)
+        try:
+            self.assertEqual(reopened.get("key"), b"value")
+        finally:
+            reopened.close()
+
+
+class TestLLMCache(unittest.TestCase):
+    """Test the two-tier LLM cache"""
+    
+    def setUp(self):
+        """Set up a persistent backend in a temporary directory"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.backend = ResponseCache(self.tmp_dir.name)
+    
+    def tearDown(self):
+        """Close the backend and remove its directory"""
+        self.backend.close()
+        self.tmp_dir.cleanup()
+    
+    def test_memory_lru_evicts_oldest(self):
+        """Test that the in-memory tier keeps only the most recently used entries"""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+        
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), b"3")
+    
+    def test_falls_back_to_backend(self):
+        """Test that memory misses are served from the persistent backend"""
+        self.backend.set("key", b"value")
+        cache = LLMCache(self.backend)
+        
+        self.assertEqual(cache.get("key"), b"value")
+    
+    def test_semantic_hit_above_threshold(self):
+        """Test that a similar story is served from the semantic tier"""
+        embeddings = FakeEmbeddings({
+            "login story": [1.0, 0.0],
+            "similar login story": [0.99, 0.1],
+            "unrelated story": [0.0, 1.0]
+        })
+        cache = LLMCache(self.backend, embeddings=embeddings, similarity_threshold=0.92)
+        cache.set("login", b"login suite", cache.embed("login story"))
+        
+        self.assertEqual(cache.get_similar(cache.embed("similar login story")), b"login suite")
+        self.assertIsNone(cache.get_similar(cache.embed("unrelated story")))
+    
+    def test_semantic_index_persists(self):
+        """Test that stored embeddings are reloaded for the same namespace only"""
+        embeddings = FakeEmbeddings({"login story": [1.0, 0.0]})
+        LLMCache(self.backend, embeddings=embeddings, namespace="gpt-3.5-turbo:0.3").set(
+            "login", b"login suite", LLMCache._normalize([1.0, 0.0])
+        )
+        
+        same_namespace = LLMCache(self.backend, embeddings=embeddings, namespace="gpt-3.5-turbo:0.3")
+        other_namespace = LLMCache(self.backend, embeddings=embeddings, namespace="gpt-4:0.3")
+        
+        self.assertEqual(same_namespace.get_similar(same_namespace.embed("login story")), b"login suite")
+        self.assertIsNone(other_namespace.get_similar(other_namespace.embed("login story")))
+
+
+if __name__ == '__main__':
+    unittest.main()
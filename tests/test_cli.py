@@ -0,0 +1,126 @@
+"""
+Unit tests for the command line interface
+"""
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from click.testing import CliRunner
+
+from test_case_agent.cli import cli
+from test_case_agent.test_case_generator import _reset_llm_pool
+
+
+def _suite_json(user_story):
+    return json.dumps({
+        "user_story": user_story,
+        "test_scenarios": [{
+            "scenario_id": "TC001",
+            "title": "Valid login test",
+            "description": "Test successful login with valid credentials",
+            "preconditions": ["User account exists"],
+            "test_steps": ["Enter valid email", "Click login"],
+            "expected_result": "User is logged in successfully",
+            "test_type": "positive",
+            "priority": "high"
+        }],
+        "coverage_areas": ["Authentication"],
+        "total_scenarios": 1
+    })
+
+
+async def _answer_story(messages):
+    """Answer with a suite naming the requested story, finishing earlier stories last"""
+    story = messages[-1].content.split("**User Story:** ", 1)[1].splitlines()[0]
+    if "first" in story:
+        await asyncio.sleep(0.05)
+    return Mock(content=_suite_json(story))
+
+
+class TestBatchCommand(unittest.TestCase):
+    """Test the batch command"""
+    
+    def setUp(self):
+        """Set up a batch input file and a mocked LLM"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.input_file = Path(self.tmp_dir.name) / "stories.json"
+        self.input_file.write_text(json.dumps([
+            "As a user, I want the first story to be slow",
+            {"story": "As a user, I want the second story to be fast", "criteria": ["Fast response"]}
+        ]))
+        
+        _reset_llm_pool()
+        self.addCleanup(_reset_llm_pool)
+        
+        self.mock_llm = Mock()
+        self.mock_llm.ainvoke = Mock(side_effect=_answer_story)
+        patcher = patch('test_case_agent.test_case_generator.ChatOpenAI', return_value=self.mock_llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        env = patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'})
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.tmp_dir.cleanup()
+    
+    def test_batch_ndjson_lines_carry_input_index(self):
+        """Test that ndjson lines identify their input story despite completion order"""
+        result = CliRunner(mix_stderr=False).invoke(
+            cli, ['batch', str(self.input_file), '-o', 'ndjson', '--no-cache']
+        )
+        
+        self.assertEqual(result.exit_code, 0, result.stderr)
+        lines = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual([line["index"] for line in lines], [1, 0])
+        self.assertIn("second story", lines[0]["test_suite"]["user_story"])
+        self.assertIn("first story", lines[1]["test_suite"]["user_story"])
+    
+    def test_batch_json_save_is_one_document(self):
+        """Test that saved json batch output is a single JSON array"""
+        save = Path(self.tmp_dir.name) / "results.json"
+        
+        result = CliRunner(mix_stderr=False).invoke(
+            cli, ['batch', str(self.input_file), '-o', 'json', '--save', str(save), '--no-cache']
+        )
+        
+        self.assertEqual(result.exit_code, 0, result.stderr)
+        suites = json.loads(save.read_text(encoding='utf-8'))
+        self.assertEqual(len(suites), 2)
+        self.assertIn("first story", suites[0]["user_story"])
+
+
+class TestDemoCommand(unittest.TestCase):
+    """Test the demo command"""
+    
+    def setUp(self):
+        """Set up a mocked LLM"""
+        _reset_llm_pool()
+        self.addCleanup(_reset_llm_pool)
+        
+        self.mock_llm = Mock()
+        self.mock_llm.ainvoke = Mock(side_effect=_answer_story)
+        patcher = patch('test_case_agent.test_case_generator.ChatOpenAI', return_value=self.mock_llm)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        env = patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'})
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def test_demo_all_json_is_one_document(self):
+        """Test that demo --example all -o json prints a single JSON array"""
+        result = CliRunner(mix_stderr=False).invoke(cli, ['demo', '--example', 'all', '-o', 'json', '--no-cache'])
+        
+        self.assertEqual(result.exit_code, 0, result.stderr)
+        suites = json.loads(result.stdout[result.stdout.index("\n[") + 1:])
+        self.assertEqual(len(suites), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
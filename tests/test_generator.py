@@ -1,16 +1,14 @@
 """
 Unit tests for the Test Case Generator AI Agent
 """
+import asyncio
+import tempfile
 import unittest
-from unittest.mock import Mock, patch
-import sys
-from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+from pydantic import ValidationError
 
-# Add src directory to path
-sys.path.append(str(Path(__file__).parent.parent / "src"))
-
-from src.test_case_generator import TestCaseGenerator
-from src.models import TestSuite, TestScenario, UserStoryInput
+from test_case_agent.test_case_generator import TestCaseGenerator, _reset_llm_pool
+from test_case_agent.models import TestSuite, TestScenario, UserStoryInput
 
 
 class TestUserStoryInput(unittest.TestCase):
@@ -39,6 +37,19 @@ class TestUserStoryInput(unittest.TestCase):
         
         self.assertEqual(input_obj.story, story)
         self.assertIsNone(input_obj.acceptance_criteria)
+    
+    def test_story_whitespace_stripped(self):
+        """Test that surrounding whitespace is stripped from the story"""
+        input_obj = UserStoryInput(story="  As a user, I want to test the system  ")
+        
+        self.assertEqual(input_obj.story, "As a user, I want to test the system")
+    
+    def test_models_are_frozen(self):
+        """Test that validated models cannot be mutated"""
+        input_obj = UserStoryInput(story="As a user, I want to test the system")
+        
+        with self.assertRaises(ValidationError):
+            input_obj.story = "As a user, I want something else"
 
 
 class TestTestCaseGenerator(unittest.TestCase):
@@ -46,6 +57,10 @@ class TestTestCaseGenerator(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures"""
+        # Each test patches ChatOpenAI, so start from an empty client pool
+        _reset_llm_pool()
+        self.addCleanup(_reset_llm_pool)
+        
         self.mock_response = Mock()
         self.mock_response.content = '''
         {
@@ -89,6 +104,18 @@ class TestTestCaseGenerator(unittest.TestCase):
             with self.assertRaises(ValueError):
                 generator.validate_user_story("Short")
     
+    def test_validate_user_story_trusted(self):
+        """Test that validation can be skipped for pre-validated input"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            
+            result = generator.validate_user_story("Short", ["Criterion"], validate=False)
+            
+            self.assertIsInstance(result, UserStoryInput)
+            self.assertEqual(result.story, "Short")
+            self.assertEqual(result.acceptance_criteria, ["Criterion"])
+            self.assertEqual(result.story_type, "feature")
+    
     def test_environment_validation(self):
         """Test that environment variables are properly validated"""
         with patch.dict('os.environ', {}, clear=True):
@@ -97,7 +124,7 @@ class TestTestCaseGenerator(unittest.TestCase):
             
             self.assertIn("OPENAI_API_KEY not found", str(context.exception))
     
-    @patch('src.test_case_generator.ChatOpenAI')
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
     def test_generate_test_cases_success(self, mock_chat_openai):
         """Test successful test case generation"""
         # Mock the OpenAI response
@@ -118,6 +145,238 @@ class TestTestCaseGenerator(unittest.TestCase):
             self.assertEqual(len(result.test_scenarios), 1)
             self.assertEqual(result.test_scenarios[0].scenario_id, "TC001")
     
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_messages_share_static_prefix(self, mock_chat_openai):
+        """Test that only the final message depends on the user story"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            
+            first = generator._build_messages(generator.validate_user_story("As a user, I want to login"))
+            second = generator._build_messages(generator.validate_user_story(
+                "As an admin, I want to manage users", ["Admins can delete users"]
+            ))
+            
+            self.assertEqual([m.content for m in first[:-1]], [m.content for m in second[:-1]])
+            self.assertIn("As an admin, I want to manage users", second[-1].content)
+            self.assertIn("- Admins can delete users", second[-1].content)
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_parse_ai_response_markdown_fence(self, mock_chat_openai):
+        """Test that JSON wrapped in a markdown code fence is extracted"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            
+            fenced = f"Here are your tests:\n```json\n{self.mock_response.content}\n```\nGood luck!"
+            result = generator._parse_ai_response(fenced)
+            
+            self.assertEqual(result, generator._parse_ai_response(self.mock_response.content))
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_parse_ai_response_errors(self, mock_chat_openai):
+        """Test that malformed and incomplete responses raise descriptive errors"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            
+            with self.assertRaises(ValueError) as context:
+                generator._parse_ai_response("not json")
+            self.assertIn("Failed to parse AI response as JSON", str(context.exception))
+            
+            with self.assertRaises(ValueError) as context:
+                generator._parse_ai_response('```json\n{"user_story": "Test story"}\n```')
+            self.assertIn("Failed to create TestSuite object", str(context.exception))
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_deterministic_overrides_temperature(self, mock_chat_openai):
+        """Test that deterministic mode generates with temperature 0"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'TEMPERATURE': '0.7'}):
+            self.assertEqual(TestCaseGenerator().temperature, 0.7)
+            
+            generator = TestCaseGenerator(deterministic=True)
+            self.assertEqual(generator.temperature, 0.0)
+            self.assertEqual(mock_chat_openai.call_args.kwargs['temperature'], 0.0)
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_generators_share_llm_client(self, mock_chat_openai):
+        """Test that generators with the same settings reuse one ChatOpenAI instance"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            first = TestCaseGenerator()
+            second = TestCaseGenerator()
+            self.assertIs(first.llm, second.llm)
+            self.assertEqual(mock_chat_openai.call_count, 1)
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'MODEL_NAME': 'gpt-4'}):
+            TestCaseGenerator()
+            self.assertEqual(mock_chat_openai.call_count, 2)
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_response_format(self, mock_chat_openai):
+        """Test that the API is asked for JSON output according to RESPONSE_FORMAT"""
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            TestCaseGenerator()
+            model_kwargs = mock_chat_openai.call_args.kwargs['model_kwargs']
+            self.assertEqual(model_kwargs['response_format'], {"type": "json_object"})
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'RESPONSE_FORMAT': 'json_schema'}):
+            TestCaseGenerator()
+            response_format = mock_chat_openai.call_args.kwargs['model_kwargs']['response_format']
+            self.assertEqual(response_format['type'], "json_schema")
+            self.assertEqual(response_format['json_schema']['schema'], TestSuite.model_json_schema())
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'RESPONSE_FORMAT': 'text'}):
+            TestCaseGenerator()
+            self.assertEqual(mock_chat_openai.call_args.kwargs['model_kwargs'], {})
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'RESPONSE_FORMAT': 'yaml'}):
+            with self.assertRaises(ValueError):
+                TestCaseGenerator()
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_stream_test_cases(self, mock_chat_openai):
+        """Test that scenarios are reported while the response streams in"""
+        content = self.mock_response.content
+        mock_llm = Mock()
+        mock_llm.stream.return_value = iter([Mock(content=content[i:i + 16]) for i in range(0, len(content), 16)])
+        mock_chat_openai.return_value = mock_llm
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            streamed = []
+            
+            result = generator.stream_test_cases(
+                "As a user, I want to login to my account",
+                on_scenario=streamed.append
+            )
+            
+            self.assertEqual(result.test_scenarios, streamed)
+            self.assertIn("TEST SCENARIO 1: TC001", generator.format_scenario(streamed[0], 1))
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_generate_test_cases_uses_cache(self, mock_chat_openai):
+        """Test that a cached story is served without calling the API again"""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = self.mock_response
+        mock_chat_openai.return_value = mock_llm
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'CACHE_DIR': cache_dir}):
+                generator = TestCaseGenerator(use_cache=True)
+                
+                first = generator.generate_test_cases("As a user, I want to login to my account")
+                second = generator.generate_test_cases("As a user, I want to login to my account")
+                generator.cache.close()
+                
+                self.assertEqual(mock_llm.invoke.call_count, 1)
+                self.assertEqual(first, second)
+    
+    @patch('test_case_agent.test_case_generator.OpenAIEmbeddings')
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_generate_test_cases_semantic_cache(self, mock_chat_openai, mock_embeddings):
+        """Test that a near-identical story is served from the semantic cache"""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = self.mock_response
+        mock_chat_openai.return_value = mock_llm
+        mock_embeddings.return_value.embed_query.side_effect = [[1.0, 0.0], [0.99, 0.05]]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            env = {'OPENAI_API_KEY': 'test-key', 'CACHE_DIR': cache_dir, 'SEMANTIC_CACHE_THRESHOLD': '0.92'}
+            with patch.dict('os.environ', env):
+                generator = TestCaseGenerator(use_cache=True)
+                
+                first = generator.generate_test_cases("As a user, I want to login to my account")
+                second = generator.generate_test_cases("As a user, I want to log in to my account")
+                generator.cache.close()
+                
+                self.assertEqual(mock_llm.invoke.call_count, 1)
+                self.assertEqual(second.test_scenarios, first.test_scenarios)
+                self.assertEqual(second.user_story, "As a user, I want to log in to my account")
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_generate_test_cases_batch(self, mock_chat_openai):
+        """Test concurrent generation for several user stories"""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=self.mock_response)
+        mock_chat_openai.return_value = mock_llm
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            completed = []
+            
+            results = generator.generate_test_cases_batch(
+                [
+                    ("As a user, I want to login to my account", ["Valid credentials required"]),
+                    ("As a user, I want to reset my password", None)
+                ],
+                on_complete=completed.append
+            )
+            
+            self.assertEqual(len(results), 2)
+            self.assertEqual(len(completed), 2)
+            self.assertEqual(mock_llm.ainvoke.await_count, 2)
+            self.assertTrue(all(isinstance(result, TestSuite) for result in results))
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_batch_generates_repeated_stories_once(self, mock_chat_openai):
+        """Test that duplicate stories in a batch share a single API call"""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=self.mock_response)
+        mock_chat_openai.return_value = mock_llm
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            story = ("As a user, I want to login to my account", ["Valid credentials required"])
+            
+            results = generator.generate_test_cases_batch(
+                [story, ("As a user, I want to reset my password", None), story]
+            )
+            
+            self.assertEqual(len(results), 3)
+            self.assertEqual(mock_llm.ainvoke.await_count, 2)
+            self.assertIs(results[0], results[2])
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_batch_malformed_criteria(self, mock_chat_openai):
+        """Test that non-string criteria in a batch raise the usual validation error"""
+        mock_llm = Mock()
+        mock_llm.ainvoke = AsyncMock(return_value=self.mock_response)
+        mock_chat_openai.return_value = mock_llm
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key'}):
+            generator = TestCaseGenerator()
+            
+            with self.assertRaises(Exception) as context:
+                generator.generate_test_cases_batch(
+                    [("As a user, I want to login to my account", [{"criterion": "Valid login"}])]
+                )
+            
+            self.assertIn("Invalid user story input", str(context.exception))
+    
+    @patch('test_case_agent.test_case_generator.ChatOpenAI')
+    def test_batch_respects_max_concurrent(self, mock_chat_openai):
+        """Test that batch generation never exceeds MAX_CONCURRENT in-flight requests"""
+        in_flight = 0
+        peak = 0
+        
+        async def slow_ainvoke(messages):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.mock_response
+        
+        mock_llm = Mock()
+        mock_llm.ainvoke = slow_ainvoke
+        mock_chat_openai.return_value = mock_llm
+        
+        with patch.dict('os.environ', {'OPENAI_API_KEY': 'test-key', 'MAX_CONCURRENT': '2'}):
+            generator = TestCaseGenerator()
+            stories = [(f"As a user, I want feature number {i}", None) for i in range(6)]
+            
+            results = generator.generate_test_cases_batch(stories)
+            
+            self.assertEqual(len(results), 6)
+            self.assertEqual(peak, 2)
+    
     def test_format_output_console(self):
         """Test console output formatting"""
         test_scenario = TestScenario(
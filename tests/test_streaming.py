@@ -0,0 +1,68 @@
+"""
+Unit tests for incremental parsing of streamed responses
+"""
+import json
+import unittest
+
+from test_case_agent.streaming import ScenarioStream
+
+
+def _scenario(scenario_id):
+    return {
+        "scenario_id": scenario_id,
+        "title": "Valid login test",
+        "description": "Test successful login with valid {credentials}",
+        "preconditions": ["User account exists"],
+        "test_steps": ["Enter valid email", "Click login"],
+        "expected_result": "User is logged in successfully",
+        "test_type": "positive",
+        "priority": "high"
+    }
+
+
+class TestScenarioStream(unittest.TestCase):
+    """Test the streamed scenario parser"""
+    
+    def setUp(self):
+        """Set up a complete response to stream"""
+        self.response = json.dumps({
+            "user_story": "As a user, I want to see \"test_scenarios\" quoted",
+            "test_scenarios": [_scenario("TC001"), _scenario("TC002")],
+            "coverage_areas": ["Authentication"],
+            "total_scenarios": 2
+        }, indent=2)
+    
+    def test_scenarios_surface_as_they_complete(self):
+        """Test that each scenario is returned by the chunk that completes it"""
+        stream = ScenarioStream()
+        first_end = self.response.index('"TC002"')
+        
+        early = stream.feed(self.response[:first_end])
+        late = stream.feed(self.response[first_end:])
+        
+        self.assertEqual([s.scenario_id for s in early], ["TC001"])
+        self.assertEqual([s.scenario_id for s in late], ["TC002"])
+        self.assertEqual(stream.text, self.response)
+    
+    def test_small_chunks(self):
+        """Test that token-sized chunks yield every scenario exactly once"""
+        stream = ScenarioStream()
+        
+        scenarios = []
+        for i in range(0, len(self.response), 3):
+            scenarios.extend(stream.feed(self.response[i:i + 3]))
+        
+        self.assertEqual([s.scenario_id for s in scenarios], ["TC001", "TC002"])
+        self.assertEqual(stream.text, self.response)
+    
+    def test_fenced_response(self):
+        """Test that a markdown-wrapped response is parsed the same way"""
+        stream = ScenarioStream()
+        
+        scenarios = stream.feed(f"```json\n{self.response}\n```")
+        
+        self.assertEqual(len(scenarios), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()